@@ -1,8 +1,9 @@
 from enum import Enum
-from typing import Annotated, Literal, Set, TypeAlias
+from typing import Annotated, Literal, Set, TypeAlias, TypeVar
 import annotated_types
 
-from pydantic import BaseModel
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
 
 
 EsID: TypeAlias = Annotated[str, annotated_types.Len(32, 32)]
@@ -34,3 +35,17 @@ class HTTPError(BaseModel):
         json_schema_extra = {
             "example": {"detail": "HTTPException raised."},
         }
+
+
+T = TypeVar("T")
+
+
+# Serializes directly to JSON bytes, skipping FastAPI's validation and encoding of
+# the response. The route should declare the response_model for documentation
+def serialize_response(
+    adapter: TypeAdapter[T], content: T, exclude_none: bool = False
+) -> Response:
+    return Response(
+        content=adapter.dump_json(content, by_alias=True, exclude_none=exclude_none),
+        media_type="application/json",
+    )
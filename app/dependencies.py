@@ -1,4 +1,4 @@
-from typing import Literal, Self
+from typing import Annotated, Literal, Self
 from fastapi import Depends, HTTPException, Query, status
 from datetime import datetime
 from app.users.schemas import Collection, FeedCreate
@@ -13,22 +13,26 @@ from app.users.auth import check_premium
 class FastapiArticleSearchQuery(ArticleSearchQuery):
     """
     Wrapper around the searchquery class used by the backend to search in elasticsearch
+
+    The query parameter metadata lives in the annotations, so the class can be used
+    directly as a dependency, while the defaults stay plain values when it's
+    instantiated by hand
     """
 
     def __init__(
         self,
-        limit: int = 0,
-        sort_by: ArticleSortBy | None = "",
-        sort_order: Literal["desc", "asc"] = "desc",
-        search_term: str | None = None,
-        semantic_search: str | None = None,
-        first_date: datetime | None = None,
-        last_date: datetime | None = None,
-        sources: set[str] | None = None,
-        ids: EsIDList | None = None,
-        highlight: bool = False,
-        highlight_symbol: str = "**",
-        cluster_id: str | None = None,
+        limit: Annotated[int, Query()] = 0,
+        sort_by: Annotated[ArticleSortBy | None, Query()] = "",
+        sort_order: Annotated[Literal["desc", "asc"], Query()] = "desc",
+        search_term: Annotated[str | None, Query()] = None,
+        semantic_search: Annotated[str | None, Query()] = None,
+        first_date: Annotated[datetime | None, Query()] = None,
+        last_date: Annotated[datetime | None, Query()] = None,
+        sources: Annotated[set[str] | None, Query()] = None,
+        ids: Annotated[EsIDList | None, Query()] = None,
+        highlight: Annotated[bool, Query()] = False,
+        highlight_symbol: Annotated[str, Query()] = "**",
+        cluster_id: Annotated[str | None, Query()] = None,
         premium: bool = Depends(check_premium),
     ):
         if semantic_search and not config_options.ELASTICSEARCH_ELSER_PIPELINE:
@@ -78,37 +82,3 @@ class FastapiArticleSearchQuery(ArticleSearchQuery):
             )
         else:
             raise NotImplemented
-
-
-class FastapiQueryParamsArticleSearchQuery(FastapiArticleSearchQuery):
-    def __init__(
-        self,
-        limit: int = Query(0),
-        sort_by: ArticleSortBy | None = Query(""),
-        sort_order: Literal["desc", "asc"] = Query("desc"),
-        search_term: str | None = Query(None),
-        semantic_search: str | None = Query(None),
-        first_date: datetime | None = Query(None),
-        last_date: datetime | None = Query(None),
-        sources: set[str] | None = Query(None),
-        ids: EsIDList | None = Query(None),
-        highlight: bool = Query(False),
-        highlight_symbol: str = Query("**"),
-        cluster_id: str | None = Query(None),
-        premium: bool = Depends(check_premium),
-    ):
-        super().__init__(
-            limit=limit,
-            sort_by=sort_by,
-            sort_order=sort_order,
-            search_term=search_term,
-            semantic_search=semantic_search,
-            first_date=first_date,
-            last_date=last_date,
-            sources=sources,
-            ids=ids,
-            highlight=highlight,
-            highlight_symbol=highlight_symbol,
-            cluster_id=cluster_id,
-            premium=premium,
-        )
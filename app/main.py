@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, Callable
 from urllib.parse import parse_qsl, urlencode
 from fastapi import FastAPI, Request
@@ -8,9 +10,19 @@ from .routers.documents import articles
 from .routers.subscriptions import feeds, collections
 from .routers import user_items
 from .routers import user
+from .users import async_db
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    async_db.open_client()
+    yield
+    await async_db.close_client()
+
 
 app = FastAPI(
     root_path="",
+    lifespan=lifespan,
 )
 
 
@@ -5,6 +5,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
+from starlette.concurrency import run_in_threadpool
 from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_422_UNPROCESSABLE_ENTITY
 from app.users import schemas
 
@@ -54,7 +55,9 @@ async def send_password_recovery_mail(
     username: str, email: str, mail_available: bool = Depends(check_mail_available)
 ) -> DefaultResponse:
     if mail_available:
-        current_user = schemas.User.model_validate(check_username(username=username))
+        current_user = schemas.User.model_validate(
+            await run_in_threadpool(check_username, username=username)
+        )
 
         if not current_user:
             raise HTTPException(
@@ -63,7 +66,7 @@ async def send_password_recovery_mail(
                 headers={"WWW-Authenticate": "Bearer"},
             )
         else:
-            if verify_user(current_user.id, username=username, email=email):
+            if await verify_user(current_user.id, username=username, email=email):
                 # This needs to send the recovery email, once implemented
                 raise NotImplemented
 
@@ -102,17 +105,17 @@ class TokenWithDetails(TypedDict):
     secure: bool
 
 
-def get_token_from_form(
+async def get_token_from_form(
     form_data: OAuth2PasswordRequestForm = Depends(), remember_me: bool = False
 ) -> TokenWithDetails:
-    user = check_username(form_data.username)
+    user = await run_in_threadpool(check_username, form_data.username)
 
     if not user:
         raise HTTPException(
             status_code=HTTP_401_UNAUTHORIZED, detail="User wasn't found"
         )
 
-    if not verify_user(
+    if not await verify_user(
         UUID(str(user._id)), user, form_data.username, form_data.password
     ):
         raise HTTPException(
@@ -210,7 +213,7 @@ async def signup(
             detail="A wrong signup code was entered",
         )
     premium = form_data.signup_code in config_options.SIGNUP_CODES
-    if create_user(
+    if await create_user(
         username=form_data.username,
         password=form_data.password,
         email=form_data.email,
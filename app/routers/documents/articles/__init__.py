@@ -1,19 +1,20 @@
 from datetime import date
 from io import BytesIO
 from typing import Any
-from uuid import UUID
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 from pathvalidate import sanitize_filename
+from starlette.concurrency import run_in_threadpool
 
 from app.users.auth import (
     check_premium,
-    get_id_from_token,
-    get_user_from_token,
+    get_optional_user_from_token,
     require_premium,
 )
 from app.users.crud import modify_collection
+from app.users.schemas import User
 from app.utils.profiles import ProfileDetails, collect_profile_details
 
 from modules.files import article_to_md
@@ -21,10 +22,7 @@ from modules.objects import BaseArticle, FullArticle
 
 from .... import config_options
 from ....common import EsID, HTTPError
-from ....dependencies import (
-    FastapiArticleSearchQuery,
-    FastapiQueryParamsArticleSearchQuery,
-)
+from ....dependencies import FastapiArticleSearchQuery
 from ....utils.documents import convert_query_to_zip, send_file
 from .rss import router as rss_router
 
@@ -32,23 +30,32 @@ router = APIRouter()
 router.include_router(rss_router, tags=["rss"])
 
 
+# The newest articles are the same for all users, apart from premium only fields,
+# so they are only queried from Elasticsearch every 15 seconds
+newest_articles_cache: TTLCache[bool, list[BaseArticle]] = TTLCache(maxsize=2, ttl=15)
+
+
 @router.get("/newest")
 async def get_newest_articles(
     premium: bool = Depends(check_premium),
 ) -> list[BaseArticle]:
-    return config_options.es_article_client.query_documents(
-        FastapiArticleSearchQuery(
-            limit=50, sort_by="publish_date", sort_order="desc", premium=premium
-        ),
-        False,
-    )[0]
+    articles = newest_articles_cache.get(premium)
+
+    if articles is None:
+        articles = config_options.es_article_client.query_documents(
+            FastapiArticleSearchQuery(
+                limit=50, sort_by="publish_date", sort_order="desc", premium=premium
+            ),
+            False,
+        )[0]
+        newest_articles_cache[premium] = articles
+
+    return articles
 
 
 @router.get("/search", response_model_exclude_unset=True)
 async def search_articles(
-    query: FastapiQueryParamsArticleSearchQuery = Depends(
-        FastapiQueryParamsArticleSearchQuery
-    ),
+    query: FastapiArticleSearchQuery = Depends(FastapiArticleSearchQuery),
     complete: bool = Query(False),
 ) -> list[BaseArticle] | list[FullArticle]:
     articles = config_options.es_article_client.query_documents(query, complete)[0]
@@ -122,20 +129,16 @@ def download_single_markdown_file(
     },
 )
 async def get_article_content(
-    id: EsID, user_id: UUID | None = Depends(get_id_from_token)
+    id: EsID, user: User | None = Depends(get_optional_user_from_token)
 ) -> FullArticle:
     article = get_single_article(id)
 
     config_options.es_article_client.increment_read_counter(id)
 
-    try:
-        if user_id:
-            user = get_user_from_token(user_id)
-            if user.already_read:
-                modify_collection(user.already_read, set([id]), user, "extend")
-
-    except HTTPException:
-        pass
+    if user and user.already_read:
+        await run_in_threadpool(
+            modify_collection, user.already_read, set([id]), user, "extend"
+        )
 
     return article
 
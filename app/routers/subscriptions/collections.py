@@ -1,9 +1,9 @@
 from typing import cast
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
 
-from app.common import EsIDList
+from app.common import EsIDList, serialize_response
 from app.users.auth import get_user_from_token
 
 from ...users import crud, schemas
@@ -11,11 +11,13 @@ from ...users import crud, schemas
 router = APIRouter()
 
 
-@router.get("/list")
-def get_my_subscribed_collections(
+@router.get("/list", response_model=dict[str, schemas.Collection])
+async def get_my_subscribed_collections(
     current_user: schemas.User = Depends(get_user_from_token),
-) -> dict[str, schemas.Collection]:
-    return crud.get_collections(current_user)
+) -> Response:
+    return serialize_response(
+        schemas.collection_dict_adapter, await crud.get_collections(current_user)
+    )
 
 
 @router.post(
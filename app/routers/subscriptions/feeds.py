@@ -1,6 +1,7 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
+from app.common import serialize_response
 from app.users.auth import get_user_from_token
 
 from ...users import crud, schemas
@@ -8,11 +9,13 @@ from ...users import crud, schemas
 router = APIRouter()
 
 
-@router.get("/list")
-def get_my_subscribed_feeds(
+@router.get("/list", response_model=dict[str, schemas.Feed])
+async def get_my_subscribed_feeds(
     current_user: schemas.User = Depends(get_user_from_token),
-) -> dict[str, schemas.Feed]:
-    return crud.get_feeds(current_user)
+) -> Response:
+    return serialize_response(
+        schemas.feed_dict_adapter, await crud.get_feeds(current_user)
+    )
 
 
 @router.post(
@@ -1,6 +1,7 @@
 from typing import Literal, cast
 from uuid import UUID
 from fastapi import APIRouter, Body, Depends, HTTPException
+from starlette.concurrency import run_in_threadpool
 from starlette.status import (
     HTTP_401_UNAUTHORIZED,
     HTTP_409_CONFLICT,
@@ -13,7 +14,12 @@ from app.users.auth import (
     get_auth_user_from_token,
     get_user_from_token,
 )
-from app.users.crud import check_username, update_user, verify_user
+from app.users.crud import (
+    hash_password,
+    update_user,
+    username_taken,
+    verify_user,
+)
 from app import config_options
 
 router = APIRouter()
@@ -27,14 +33,14 @@ async def get_auth_status(
 
 
 @router.post("/credentials")
-def change_credentials(
+async def change_credentials(
     id: UUID = Depends(ensure_id_from_token),
     password: str = Body(...),
     new_username: str | None = Body(None),
     new_password: str | None = Body(None),
     new_email: str | None = Body(None),
 ) -> schemas.User:
-    user = verify_user(id, password=password)
+    user = await verify_user(id, password=password)
     if not user or not user.rev:
         raise HTTPException(
             status_code=HTTP_401_UNAUTHORIZED,
@@ -45,7 +51,7 @@ def change_credentials(
     user_schema = schemas.AuthUser.model_validate(user)
 
     if new_username:
-        if check_username(new_username):
+        if await run_in_threadpool(username_taken, new_username):
             raise HTTPException(
                 status_code=HTTP_409_CONFLICT,
                 detail="Username is already taken",
@@ -53,11 +59,11 @@ def change_credentials(
         user_schema.username = new_username
 
     if new_password:
-        user_schema.hashed_password = config_options.hasher.hash(new_password)
+        user_schema.hashed_password = await hash_password(new_password)
     if new_email:
-        user_schema.hashed_email = config_options.hasher.hash(new_email)
+        user_schema.hashed_email = await hash_password(new_email)
 
-    update_user(user_schema, rev)
+    await run_in_threadpool(update_user, user_schema, rev)
 
     return user_schema
 
@@ -3,11 +3,11 @@ from io import BytesIO
 from typing_extensions import Any, TypeVar
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import StreamingResponse
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
 
-from app.common import EsIDList, HTTPError
+from app.common import EsIDList, HTTPError, serialize_response
 from app.dependencies import FastapiArticleSearchQuery
 from app.users import crud, schemas
 from app.users.auth import check_premium, get_user_from_token
@@ -155,14 +155,19 @@ def update_collection(
 
 @router.get(
     "/standard/feeds",
+    response_model=dict[str, schemas.Feed],
     response_model_exclude_none=True,
 )
-def get_standard_items() -> dict[str, schemas.Feed]:
-    standard_user = crud.get_full_user_object(UUID(int=0))
+async def get_standard_items() -> Response:
+    standard_user = await crud.get_full_user_object(UUID(int=0))
 
     if not standard_user:
         raise HTTPException(
             status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail="Backend setup missing"
         )
 
-    return crud.get_feeds(standard_user)
+    return serialize_response(
+        schemas.feed_dict_adapter,
+        await crud.get_feeds(standard_user),
+        exclude_none=True,
+    )
@@ -15,6 +15,13 @@ class FeedFactory(ModelFactory):
     __model__ = FeedCreate
 
 
+# Runs the app's lifespan for the whole session, as it opens the CouchDB client
+@pytest.fixture(scope="session", autouse=True)
+def app_lifespan():
+    with client:
+        yield
+
+
 @pytest.fixture
 def auth_user():
     print("Authing!", end=" ")
@@ -0,0 +1,64 @@
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.users import auth
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    calls: list[str] = []
+    decode = auth.jwt.decode
+
+    def counting_decode(token, *args, **kwargs):
+        calls.append(token)
+        return decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+    monkeypatch.setattr(auth, "_token_cache", auth.OrderedDict())
+
+    return calls
+
+
+def test_valid_token_cached_until_exp(decode_calls):
+    id = uuid4()
+    token = auth.create_access_token({"sub": str(id)}, timedelta(hours=1))
+
+    assert auth.decode_token(token) == id
+    assert auth.decode_token(token) == id
+    assert len(decode_calls) == 1
+
+    _, expire = next(iter(auth._token_cache.values()))
+    assert expire > auth.time()
+
+
+def test_expired_entry_decoded_again(decode_calls, monkeypatch):
+    id = uuid4()
+    token = auth.create_access_token({"sub": str(id)}, timedelta(hours=1))
+
+    assert auth.decode_token(token) == id
+
+    _, expire = next(iter(auth._token_cache.values()))
+    monkeypatch.setattr(auth, "time", lambda: expire + 1)
+
+    assert auth.decode_token(token) == id
+    assert len(decode_calls) == 2
+
+
+def test_invalid_token_cached_as_error(decode_calls):
+    assert auth.decode_token("not-a-token") is None
+    assert auth.decode_token("not-a-token") is None
+    assert len(decode_calls) == 1
+
+    cached_id, _ = next(iter(auth._token_cache.values()))
+    assert cached_id is auth._CACHED_ERROR
+
+
+def test_cache_stays_within_size(decode_calls, monkeypatch):
+    monkeypatch.setattr(auth, "TOKEN_CACHE_SIZE", 3)
+
+    for i in range(10):
+        auth.decode_token(f"invalid-token-{i}")
+
+    assert len(auth._token_cache) == 3
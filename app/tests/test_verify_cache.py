@@ -0,0 +1,98 @@
+import asyncio
+
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+from cachetools import TTLCache
+import pytest
+
+from app.users import crud
+
+
+class CountingHasher:
+    def __init__(self) -> None:
+        self.hasher = PasswordHasher()
+        self.verify_calls = 0
+
+    def hash(self, password: str) -> str:
+        return self.hasher.hash(password)
+
+    def verify(self, hashed_password: str, password: str) -> bool:
+        self.verify_calls += 1
+        return self.hasher.verify(hashed_password, password)
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def hasher(monkeypatch):
+    counting_hasher = CountingHasher()
+
+    # Runs the hasher in the default thread pool, so calls can be counted
+    monkeypatch.setattr(crud.config_options, "hasher", counting_hasher)
+    monkeypatch.setattr(crud.config_options, "hash_executor", None)
+
+    return counting_hasher
+
+
+@pytest.fixture
+def timer(monkeypatch):
+    fake_timer = FakeTimer()
+
+    monkeypatch.setattr(
+        crud,
+        "_verify_cache",
+        TTLCache(
+            maxsize=crud.VERIFY_CACHE_SIZE, ttl=crud.VERIFY_CACHE_TTL, timer=fake_timer
+        ),
+    )
+
+    return fake_timer
+
+
+def test_successful_verify_cached(hasher, timer):
+    hashed = hasher.hash("password")
+
+    assert asyncio.run(crud.verify_password(hashed, "password"))
+    assert asyncio.run(crud.verify_password(hashed, "password"))
+    assert hasher.verify_calls == 1
+
+
+def test_cached_verify_expires(hasher, timer):
+    hashed = hasher.hash("password")
+
+    assert asyncio.run(crud.verify_password(hashed, "password"))
+
+    timer.now += crud.VERIFY_CACHE_TTL + 1
+
+    assert asyncio.run(crud.verify_password(hashed, "password"))
+    assert hasher.verify_calls == 2
+
+
+def test_failed_verify_not_cached(hasher, timer):
+    hashed = hasher.hash("password")
+
+    for _ in range(2):
+        with pytest.raises(VerifyMismatchError):
+            asyncio.run(crud.verify_password(hashed, "wrong password"))
+
+    assert hasher.verify_calls == 2
+
+
+def test_cache_stays_within_size(hasher, timer, monkeypatch):
+    monkeypatch.setattr(
+        crud,
+        "_verify_cache",
+        TTLCache(maxsize=2, ttl=crud.VERIFY_CACHE_TTL, timer=timer),
+    )
+
+    for i in range(3):
+        password = f"password-{i}"
+        assert asyncio.run(crud.verify_password(hasher.hash(password), password))
+
+    assert len(crud._verify_cache) == 2
@@ -0,0 +1,65 @@
+from collections.abc import Iterable
+from typing import Any
+
+from httpx import AsyncClient, Limits
+
+from app import config_options
+
+# The couchdb library blocks the event loop for the duration of every request, so
+# the lookups done on most requests go directly to CouchDB's HTTP API instead.
+# Pooled connections are bound to the event loop they were opened on, so the
+# client is opened and closed by the app's lifespan, on the loop serving requests
+_client: AsyncClient | None = None
+
+
+def open_client() -> None:
+    global _client
+
+    _client = AsyncClient(
+        base_url=config_options.COUCHDB_URL, limits=Limits(max_connections=100)
+    )
+
+
+async def close_client() -> None:
+    global _client
+
+    if _client:
+        await _client.aclose()
+        _client = None
+
+
+def get_client() -> AsyncClient:
+    if not _client:
+        raise RuntimeError("The CouchDB client is only open while the app is running")
+
+    return _client
+
+
+async def get_document(id: str) -> dict[str, Any] | None:
+    response = await get_client().get(f"{config_options.couch_conn.name}/{id}")
+
+    if response.status_code == 404:
+        return None
+
+    response.raise_for_status()
+
+    document: dict[str, Any] = response.json()
+    return document
+
+
+# Missing and deleted documents are skipped
+async def get_documents(ids: Iterable[str]) -> list[dict[str, Any]]:
+    keys = list(ids)
+
+    if not keys:
+        return []
+
+    response = await get_client().post(
+        f"{config_options.couch_conn.name}/_all_docs",
+        params={"include_docs": "true"},
+        json={"keys": keys},
+    )
+
+    response.raise_for_status()
+
+    return [row["doc"] for row in response.json()["rows"] if row.get("doc")]
@@ -1,4 +1,8 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from hashlib import blake2b
+from math import inf
+from time import time
 from typing import Any
 from uuid import UUID
 
@@ -30,26 +34,59 @@ def create_access_token(
     return encoded_jwt
 
 
-async def get_id_from_token(request: Request) -> UUID | None:
-    token = await oauth2_scheme(request)
+class _CachedError:
+    pass
+
+
+_CACHED_ERROR = _CachedError()
+
+TOKEN_CACHE_SIZE = 4096
+
+# Decoded tokens are cached by a hash of the token, so the raw tokens aren't kept
+# in memory. Failed decodes are cached as well, as an invalid token stays invalid
+_token_cache: OrderedDict[str, tuple[UUID | _CachedError, float]] = OrderedDict()
 
-    if not token:
-        return None
 
+def decode_token(token: str) -> UUID | None:
+    key = blake2b(token.encode(), digest_size=16).hexdigest()
+
+    if key in _token_cache:
+        cached_id, expire = _token_cache[key]
+
+        if expire > time():
+            _token_cache.move_to_end(key)
+            return None if isinstance(cached_id, _CachedError) else cached_id
+
+        del _token_cache[key]
+
+    id: UUID | _CachedError
     try:
         payload = jwt.decode(
             token, config_options.SECRET_KEY, algorithms=config_options.JWT_ALGORITHMS
         )
-        id: str | None = payload.get("sub")
+        sub: str | None = payload.get("sub")
 
-        if id:
-            return UUID(id)
-        else:
-            return None
+        id = UUID(sub) if sub else _CACHED_ERROR
+        expire = float(payload.get("exp", inf))
 
     except JWTError:
+        id, expire = _CACHED_ERROR, inf
+
+    _token_cache[key] = (id, expire)
+    if len(_token_cache) > TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+
+    return None if isinstance(id, _CachedError) else id
+
+
+async def get_id_from_token(request: Request) -> UUID | None:
+    token = await oauth2_scheme(request)
+
+    if not token:
         return None
 
+    return decode_token(token)
+
 
 def ensure_id_from_token(
     id: None | UUID = Depends(get_id_from_token),
@@ -64,10 +101,20 @@ def ensure_id_from_token(
     return id
 
 
+# Shared by the dependencies below, so the user is only loaded once per request
+async def get_optional_user_from_token(
+    id: UUID | None = Depends(get_id_from_token),
+) -> User | None:
+    if id is None:
+        return None
+
+    return await get_full_user_object(id)
+
+
 def get_user_from_token(
-    id: UUID = Depends(ensure_id_from_token),
+    _: UUID = Depends(ensure_id_from_token),
+    user: User | None = Depends(get_optional_user_from_token),
 ) -> User:
-    user = get_full_user_object(id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -78,10 +125,10 @@ def get_user_from_token(
     return user
 
 
-def get_auth_user_from_token(
+async def get_auth_user_from_token(
     id: UUID = Depends(ensure_id_from_token),
 ) -> User:
-    user = get_full_user_object(id, auth=True)
+    user = await get_full_user_object(id, auth=True)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -92,11 +139,7 @@ def get_auth_user_from_token(
     return user
 
 
-def check_premium(id: UUID | None = Depends(get_id_from_token)) -> bool:
-    if not id:
-        return False
-
-    user = get_full_user_object(id)
+def check_premium(user: User | None = Depends(get_optional_user_from_token)) -> bool:
     if not user:
         return False
 
@@ -1,38 +1,149 @@
-from typing import Literal, cast
+import asyncio
+from collections.abc import Iterable
+from hashlib import sha256
+from typing import Any, Literal, cast
 from uuid import UUID, uuid4
 
 from argon2.exceptions import VerifyMismatchError
+from cachetools import TTLCache
 from couchdb import Document, ResourceNotFound
 from couchdb.client import ViewResults
-from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
 from app import config_options
-from app.users import models, schemas
+from app.users import async_db, models, schemas
 
+# Indexing the view results creates a new query with its own options, so the view
+# handles themselves can be shared between requests
+_users_by_username: ViewResults = models.User.by_username(config_options.couch_conn)
+_usernames: ViewResults = models.User.usernames(config_options.couch_conn)
 
-def duplicate_document(
-    document: models.DBModels,
-    document_class: type[models.DBModels],
-    contents: schemas.ORMBase,
-) -> models.DBModels:
-    rev = document.rev
-    new_document = document_class(**contents.db_serialize())
-    new_document._data["_rev"] = rev
-    return new_document
+
+async def hash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        config_options.hash_executor, config_options.hasher.hash, password
+    )
+
+
+VERIFY_CACHE_SIZE = 1024
+VERIFY_CACHE_TTL = 5
+
+# Successful verifications are remembered for a few seconds, keyed by the hash and
+# a digest of the password, so retried logins don't pay for Argon2 again
+_verify_cache: TTLCache[tuple[str, str], bool] = TTLCache(
+    maxsize=VERIFY_CACHE_SIZE, ttl=VERIFY_CACHE_TTL
+)
+
+
+# Raises VerifyMismatchError like the underlying hasher, if the password doesn't match
+async def verify_password(hashed_password: str, password: str) -> bool:
+    key = (hashed_password, sha256(password.encode()).hexdigest())
+
+    if key in _verify_cache:
+        return True
+
+    loop = asyncio.get_running_loop()
+    verified = await loop.run_in_executor(
+        config_options.hash_executor,
+        config_options.hasher.verify,
+        hashed_password,
+        password,
+    )
+
+    _verify_cache[key] = verified
+
+    return verified
+
+
+def _encode_ids(ids: Iterable[UUID | str]) -> list[str]:
+    return [str(id) for id in ids]
+
+
+# Looks documents up by id in the primary index, which unlike views doesn't have to
+# be brought up to date with recent writes before answering. Missing and deleted
+# documents are skipped
+async def _get_documents(ids: Iterable[UUID]) -> list[dict[str, Any]]:
+    return await async_db.get_documents(_encode_ids(ids))
+
+
+async def _load_user(id: UUID) -> models.User | None:
+    document = await async_db.get_document(str(id))
+    return models.User.wrap(document) if document else None
+
+
+def _optional_uuid(value: str | None) -> UUID | None:
+    return UUID(value) if value else None
+
+
+# Documents read from the DB were validated when they were written, so the
+# (expensive) validation is skipped when wrapping them in schemas on read. Only
+# the schema's own fields are picked out, as the documents also carry keys like
+# _rev and the hashed credentials
+def _stored_fields(
+    schema: type[BaseModel], data: dict[str, Any], exclude: set[str] = set()
+) -> dict[str, Any]:
+    return {
+        name: data[field.alias or name]
+        for name, field in schema.model_fields.items()
+        if name not in exclude and (field.alias or name) in data
+    }
+
+
+def _construct_feed(feed: models.Feed) -> schemas.Feed:
+    return schemas.Feed.model_construct(
+        **{
+            **_stored_fields(schemas.Feed, feed._data),
+            "id": UUID(feed._id),
+            "owner": _optional_uuid(feed.owner),
+            "first_date": feed.first_date,
+            "last_date": feed.last_date,
+            "sources": set(feed.sources),
+        }
+    )
+
+
+def _construct_collection(collection: models.Collection) -> schemas.Collection:
+    return schemas.Collection.model_construct(
+        **{
+            **_stored_fields(schemas.Collection, collection._data),
+            "id": UUID(collection._id),
+            "owner": _optional_uuid(collection.owner),
+            "ids": set(collection.ids),
+        }
+    )
+
+
+def _construct_user(user: models.User) -> schemas.User:
+    return schemas.User.model_construct(
+        **{
+            # Feeds and collections are loaded separately from their own documents
+            **_stored_fields(
+                schemas.User, user._data, exclude={"feeds", "collections"}
+            ),
+            "id": UUID(user._id),
+            "already_read": _optional_uuid(user.already_read),
+            "feed_ids": {UUID(id) for id in user.feed_ids},
+            "collection_ids": {UUID(id) for id in user.collection_ids},
+            "settings": schemas.UserSettings.model_construct(
+                **_stored_fields(schemas.UserSettings, user._data.get("settings") or {})
+            ),
+        }
+    )
 
 
 def check_username(username: str) -> Literal[False] | models.User:
-    try:
-        return cast(
-            models.User,
-            list(models.User.by_username(config_options.couch_conn)[username])[0],
-        )
-    except IndexError:
-        return False
+    user: models.User | None = next(iter(_users_by_username[username]), None)
+    return user if user else False
+
+
+def username_taken(username: str) -> bool:
+    return next(iter(_usernames[username]), None) is not None
 
 
 # Return of db model for user is for use in following crud functions
-def verify_user(
+async def verify_user(
     id: UUID,
     user: models.User | None = None,
     username: str | None = None,
@@ -40,7 +151,7 @@ def verify_user(
     email: str | None = None,
 ) -> Literal[False] | models.User:
     if not user:
-        user = models.User.load(config_options.couch_conn, str(id))
+        user = await _load_user(id)
 
     if not user:
         return False
@@ -55,17 +166,17 @@ def verify_user(
     ]:
         if raw_value and hashed_value:
             try:
-                config_options.hasher.verify(hashed_value, raw_value)
+                await verify_password(hashed_value, raw_value)
             except VerifyMismatchError:
                 return False
 
     return user
 
 
-def get_full_user_object(
+async def get_full_user_object(
     id: UUID, complete: bool = False, auth: bool = False
 ) -> None | schemas.User | schemas.AuthUser:
-    user: models.User | None = models.User.load(config_options.couch_conn, str(id))
+    user = await _load_user(id)
 
     if not user:
         return None
@@ -74,35 +185,44 @@ def get_full_user_object(
     if auth:
         user_schema = schemas.AuthUser.model_validate(user)
     else:
-        user_schema = schemas.User.model_validate(user)
+        user_schema = _construct_user(user)
 
+    # Fetches feeds and collections in one round-trip
     if complete:
-        user_schema.feeds = list(get_feeds(user_schema).values())
-        user_schema.collections = list(get_collections(user_schema).values())
+        ids = user_schema.feed_ids | user_schema.collection_ids
+        for doc in await _get_documents(ids):
+            if doc["type"] == "feed":
+                user_schema.feeds.append(_construct_feed(models.Feed.wrap(doc)))
+            elif doc["type"] == "collection":
+                user_schema.collections.append(
+                    _construct_collection(models.Collection.wrap(doc))
+                )
 
     return user_schema
 
 
 # Ensures that usernames are unique
-def create_user(
+async def create_user(
     username: str,
     password: str,
     email: str | None = "",
     id: UUID | None = None,
     premium: int = 0,
 ) -> bool:
-    if check_username(username):
+    if await run_in_threadpool(username_taken, username):
         return False
 
-    if email:
-        email_hash = config_options.hasher.hash(email)
-    else:
-        email_hash = None
-
     if not id:
         id = uuid4()
 
-    password_hash = config_options.hasher.hash(password)
+    # Both hashes are computed in parallel, given at least two hashing processes
+    email_hash: str | None
+    if email:
+        password_hash, email_hash = await asyncio.gather(
+            hash_password(password), hash_password(email)
+        )
+    else:
+        password_hash, email_hash = await hash_password(password), None
 
     new_user = models.User(
         _id=str(id),
@@ -113,11 +233,17 @@ def create_user(
         premium=premium,
     )
 
-    collection = create_collection("Already Read", id, deleteable=False)
-    new_user.already_read = collection.id
+    collection = schemas.Collection(name="Already Read", owner=id, deleteable=False)
+    new_user.already_read = str(collection.id)
+    new_user.collection_ids = [str(collection.id)]
 
-    new_user.store(config_options.couch_conn)
-    modify_user_subscription(id, set([collection.id]), "subscribe", "collection")
+    # Stores the user together with its subscribed collection in a single request
+    for success, _, error in await run_in_threadpool(
+        config_options.couch_conn.update,
+        [new_user, models.Collection(**collection.db_serialize())],
+    ):
+        if not success:
+            raise error
 
     return True
 
@@ -159,32 +285,30 @@ def modify_user_subscription(
     if not user:
         return None
 
-    user_schema = schemas.AuthUser.model_validate(user)
-
+    # Modifies the stored id lists in place, instead of round-tripping the whole
+    # user document through the schema
     if item_type == "feed":
-        source = user_schema.feed_ids
+        source = set(user.feed_ids)
     elif item_type == "collection":
-        source = user_schema.collection_ids
+        source = set(user.collection_ids)
     else:
         raise NotImplementedError
 
     if action == "subscribe":
-        source = source.union(ids)
+        source.update(_encode_ids(ids))
     elif action == "unsubscribe":
-        source.difference_update(ids)
+        source.difference_update(_encode_ids(ids))
     else:
         raise NotImplementedError
 
     if item_type == "feed":
-        user_schema.feed_ids = source
+        user.feed_ids = list(source)
     elif item_type == "collection":
-        user_schema.collection_ids = source
-
-    user = duplicate_document(user, models.User, user_schema)
+        user.collection_ids = list(source)
 
     user.store(config_options.couch_conn)
 
-    return user_schema
+    return _construct_user(user)
 
 
 def create_feed(
@@ -241,22 +365,19 @@ def create_collection(
     return collection
 
 
-def get_feeds(user: schemas.User) -> dict[str, schemas.Feed]:
-    all_feeds: ViewResults = models.Feed.all(config_options.couch_conn)
-
-    all_feeds.options["keys"] = jsonable_encoder(user.feed_ids)
-
-    return {feed._id: schemas.Feed.model_validate(feed) for feed in all_feeds}
-
-
-def get_collections(user: schemas.User) -> dict[str, schemas.Collection]:
-    all_collections: ViewResults = models.Collection.all(config_options.couch_conn)
+async def get_feeds(user: schemas.User) -> dict[str, schemas.Feed]:
+    return {
+        doc["_id"]: _construct_feed(models.Feed.wrap(doc))
+        for doc in await _get_documents(user.feed_ids)
+        if doc["type"] == "feed"
+    }
 
-    all_collections.options["keys"] = jsonable_encoder(user.collection_ids)
 
+async def get_collections(user: schemas.User) -> dict[str, schemas.Collection]:
     return {
-        collection._id: schemas.Collection.model_validate(collection)
-        for collection in all_collections
+        doc["_id"]: _construct_collection(models.Collection.wrap(doc))
+        for doc in await _get_documents(user.collection_ids)
+        if doc["type"] == "collection"
     }
 
 
@@ -310,7 +431,9 @@ def modify_collection(
     if action == "replace":
         item.ids = list(contents)
     elif action == "extend":
-        item.ids.extend(list(contents))  # pyright: ignore
+        existing_ids = set(item.ids)
+        existing_ids.update(contents)
+        item.ids = list(existing_ids)
 
     item.store(config_options.couch_conn)
 
@@ -59,6 +59,18 @@ class User(Document):  # type: ignore[misc]
         }""",
     )
 
+    # Only emits the key, for checking whether a username is taken
+    usernames = ViewField(
+        "users",
+        """
+        function(doc) {
+            if(doc.type == "user") {
+                emit(doc.username, null)
+            }
+        }""",
+        wrapper=None,
+    )
+
 
 class ItemBase(Document):  # type: ignore[misc]
     _id = TextField()
@@ -86,16 +98,6 @@ class Feed(ItemBase):
     type = TextField(default="feed")
 
     # Views
-    all = ViewField(
-        "feeds",
-        """
-        function(doc) {
-            if(doc.type == "feed") {
-                emit(doc._id, doc);
-            }
-        }""",
-    )
-
     get_minimal_info = ViewField(
         "feeds",
         """
@@ -113,16 +115,6 @@ class Collection(ItemBase):
     type = TextField(default="collection")
 
     # Views
-    all = ViewField(
-        "collections",
-        """
-        function(doc) {
-            if(doc.type == "collection") {
-                emit(doc._id, doc);
-            }
-        }""",
-    )
-
     get_minimal_info = ViewField(
         "collections",
         """
@@ -139,7 +131,6 @@ DBModels = TypeVar("DBModels", Feed, Collection, User)
 views: list[ViewDefinition] = [
     User.all,
     User.by_username,
-    Feed.all,
+    User.usernames,
     Feed.get_minimal_info,
-    Collection.all,
 ]
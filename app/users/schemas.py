@@ -4,7 +4,7 @@ from typing import Annotated, Any, Literal, TypeAlias, Union
 from uuid import UUID, uuid4
 from couchdb.mapping import ListField
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from app.common import ArticleSortBy
 
 
@@ -90,6 +90,11 @@ class Collection(ItemBase):
 
 UserItem: TypeAlias = Annotated[Union[Feed, Collection], Field(discriminator="type")]
 
+feed_dict_adapter: TypeAdapter[dict[str, Feed]] = TypeAdapter(dict[str, Feed])
+collection_dict_adapter: TypeAdapter[dict[str, Collection]] = TypeAdapter(
+    dict[str, Collection]
+)
+
 
 class UserSettings(ORMBase):
     dark_mode: bool = True
@@ -1,3 +1,4 @@
+import asyncio
 from uuid import UUID
 from app.users import schemas
 from app.users import crud
@@ -69,7 +70,9 @@ standard_feeds = {
 
 def create_standard_items() -> None:
     crud.remove_user("OSINTer")
-    crud.create_user(username="OSINTer", password=token_urlsafe(64), id=UUID(int=0))
+    asyncio.run(
+        crud.create_user(username="OSINTer", password=token_urlsafe(64), id=UUID(int=0))
+    )
 
     stored_feeds: set[UUID] = set()
 
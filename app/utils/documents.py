@@ -8,10 +8,7 @@ from fastapi.responses import StreamingResponse
 from modules.files import article_to_md
 
 from .. import config_options
-from ..dependencies import (
-    FastapiArticleSearchQuery,
-    FastapiQueryParamsArticleSearchQuery,
-)
+from ..dependencies import FastapiArticleSearchQuery
 
 # TODO:Optimize functions sending files (especially the zip file) as to not save
 # files in memory but on disk
@@ -35,7 +32,7 @@ def send_file(
 
 
 def convert_query_to_zip(
-    search_q: FastapiArticleSearchQuery = Depends(FastapiQueryParamsArticleSearchQuery),
+    search_q: FastapiArticleSearchQuery = Depends(FastapiArticleSearchQuery),
 ) -> BytesIO:
     articles = config_options.es_article_client.query_documents(search_q, True)[0]
 
@@ -12,9 +12,9 @@ class ProfileDetails(TypedDict):
 
 
 def collect_profile_details() -> dict[str, ProfileDetails]:
-    db_stored_profiles = list(
-        config_options.es_article_client.get_unique_values(field_name="profile").keys()
-    )
+    db_stored_profiles = config_options.es_article_client.get_unique_values(
+        field_name="profile"
+    ).keys()
 
     profiles = sorted(get_profiles(), key=lambda profile: profile.source.profile_name)
 
@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import os
 import secrets
 
@@ -56,7 +58,18 @@ class FrontendConfig(BaseConfig):
         signup_code = os.environ.get("SIGNUP_CODES", None)
         self.SIGNUP_CODES = signup_code.split(",") if signup_code else []
 
-        self.hasher = PasswordHasher()
+        # OWASP's Argon2id configuration of 19 MiB memory, 2 iterations and 1 degree of
+        # parallelism, which costs less per hash than argon2-cffi's 64 MiB default
+        self.hasher = PasswordHasher(time_cost=2, memory_cost=19 * 1024, parallelism=1)
+        # Hashing is CPU bound, so it's kept out of the event loop in separate
+        # processes. Every gunicorn worker gets its own pool, so it's kept small by
+        # default, though with room for the password and email hashes on signup. The
+        # pool uses forkserver as forking a process with running threads can deadlock
+        self.HASH_WORKERS = int(os.environ.get("HASH_WORKERS") or 2)
+        self.hash_executor = ProcessPoolExecutor(
+            max_workers=self.HASH_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
 
     @staticmethod
     def get_env_bool(key: str) -> bool:
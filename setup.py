@@ -6,20 +6,29 @@ from dotenv import load_dotenv
 
 from config import FrontendConfig
 
-load_dotenv()
+# The password hashing pool starts its processes with forkserver, which imports this
+# script again in the fork server, so the setup only runs when executed directly
+if __name__ == "__main__":
+    load_dotenv()
 
-couch = Server(FrontendConfig.get_couchdb_details()[0])
+    couch = Server(FrontendConfig.get_couchdb_details()[0])
 
-try:
-    couch.create(FrontendConfig.get_couchdb_details()[1])
-except PreconditionFailed:
-    pass
+    try:
+        couch.create(FrontendConfig.get_couchdb_details()[1])
+    except PreconditionFailed:
+        pass
 
+    from app import config_options
 
-from app import config_options
+    from app.users.models import views
+    from app.users.standard import create_standard_items
 
-from app.users.models import views
-from app.users.standard import create_standard_items
+    # Views that are no longer defined are removed from their design documents, and
+    # the collections design document is dropped, as none of its views are synced
+    ViewDefinition.sync_many(config_options.couch_conn, views, remove_missing=True)
 
-ViewDefinition.sync_many(config_options.couch_conn, views)
-create_standard_items()
+    collections_design = config_options.couch_conn.get("_design/collections")
+    if collections_design:
+        config_options.couch_conn.delete(collections_design)
+
+    create_standard_items()